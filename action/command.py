@@ -19,11 +19,31 @@ from typing import Dict, Any
 from types import NoneType
 
 import re
+import sys
 import yaml
-import dacite
 
 
-@dataclass
+# Use the libyaml-backed loader when PyYAML was built with it,
+# it parses task files several times faster than the pure Python one.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Matches the ${{ variable }} syntax in commands.
+_VAR_RE = re.compile(r"\$\{\{([\sa-zA-Z0-9_\-]*)\}\}")
+
+# YAML keys that differ from the dataclass field names.
+_COMMAND_NAME_MAP = {
+    "check-exit-code": "check_exit_code",
+    "should-fail": "should_fail",
+}
+
+_TASK_NAME_MAP = {
+    "fail-fast": "fail_fast",
+    "check-exit-code": "check_exit_code",
+    "should-fail": "should_fail",
+}
+
+
+@dataclass(slots=True)
 class Command:
     """
     Stores a Shell command with custom configuration options
@@ -36,33 +56,42 @@ class Command:
     check_exit_code: bool | NoneType = None
     should_fail: bool | NoneType = None
 
-    def __getitem__(self, item):
-        return getattr(self, item)
-
-    def __setitem__(self, key, item):
-        setattr(self, key, item)
+    def _apply_task_properties(self, task: 'Task', default_expect: str) -> None:
+        """
+        Fill in the properties that were not set on the Command itself
+        with the values from its Task.
 
-    def _apply_task_properties(self, keys: list[str], defaults: list[Any], task_values: list[Any]):
+        Parameters
+        ----------
+        task : the Task this Command belongs to
+        default_expect : expect pattern of the Shell the Task runs on
+        """
 
-        for it, key in enumerate(keys):
-            self[key] = task_values[it]       \
-                if self[key] == defaults[it]  \
-                else self[key]
+        if self.timeout == -1:
+            self.timeout = task.timeout
+        if self.expect is None:
+            self.expect = default_expect
+        if self.echo is None:
+            self.echo = task.echo
+        if self.check_exit_code is None:
+            self.check_exit_code = task.check_exit_code
+        if self.should_fail is None:
+            self.should_fail = task.should_fail
 
     @staticmethod
-    def load_from_dict(dict: Dict[str, Any] | str):
+    def load_from_dict(data: Dict[str, Any] | str):
 
-        if type(dict) == str:
-            dict = {"command": dict}
-        elif not dict.get("command"):
-            dict["command"] = ""
+        if isinstance(data, str):
+            data = {"command": data}
+        elif not data.get("command"):
+            data["command"] = ""
 
-        name_map = {name: name for name in dict.keys()} | {
-            "check-exit-code": "check_exit_code",
-            "should-fail": "should_fail",
-        }
+        # Short commands repeat a lot between task files, interning them
+        # turns later dictionary lookups into pointer comparisons.
+        if isinstance(data["command"], str) and len(data["command"]) < 64:
+            data["command"] = sys.intern(data["command"])
 
-        return dacite.from_dict(data_class=Command, data={name_map[name]: value for name, value in dict.items()})
+        return Command(**{_COMMAND_NAME_MAP.get(name, name): value for name, value in data.items()})
 
     def apply_vars(self, vars: Dict[str, str]):
         """
@@ -73,19 +102,21 @@ class Command:
         vars : dictionary with pairs: name, value
         """
 
-        variable_group = r"\$\{\{([\sa-zA-Z0-9_\-]*)\}\}"
+        if "${{" not in self.command:
+            return
 
-        for match in re.finditer(variable_group, self.command):
-            pattern = match[0]
-            var_name = match[1]
+        def resolve(match: re.Match) -> str:
+            var_name = sys.intern(match[1])
 
-            if var_name in vars:
-                self.command = self.command.replace(pattern, vars[var_name])
-            else:
+            if var_name not in vars:
                 error(f"Variable {var_name} not found!")
 
+            return vars[var_name]
 
-@dataclass
+        self.command = _VAR_RE.sub(resolve, self.command)
+
+
+@dataclass(slots=True)
 class Task:
     """
     A Task is a block of commands that are performed on one shell and have
@@ -118,19 +149,44 @@ class Task:
         ----------
         default_vars : global variables dictionary
         """
+        merged_vars = {
+            sys.intern(name): value
+            for name, value in (default_vars | self.vars | override_variables).items()
+        }
+
         for command in self.commands:
-            command.apply_vars(default_vars | self.vars | override_variables)
+            command.apply_vars(merged_vars)
 
     @staticmethod
-    def load_from_dict(dict: Dict[str, Any]) -> 'Task':
+    def load_from_dict(data: Dict[str, Any]) -> 'Task':
 
-        name_map = {name: name for name in dict.keys()} | {
-            "fail-fast": "fail_fast",
-            "check-exit-code": "check_exit_code",
-            "should-fail": "should_fail",
-        }
+        return Task(**{_TASK_NAME_MAP.get(name, name): value for name, value in data.items()})
 
-        return dacite.from_dict(data_class=Task, data={name_map[name]: value for name, value in dict.items()})
+    @staticmethod
+    def peek_header(yaml_string: str) -> Dict[str, Any]:
+        """
+        Read only the top-level scalar fields (like 'name' or 'shell') from
+        the beginning of a task YAML. This avoids parsing the whole document
+        when the header alone decides whether the Task is of interest; use
+        load_from_yaml to actually construct the Task.
+
+        Parameters
+        ----------
+        yaml_string : string with YAML
+        """
+
+        header = "\n".join(yaml_string.split("\n", 10)[:10])
+
+        try:
+            obj = yaml.load(header, Loader=_YAML_LOADER)
+        except yaml.YAMLError:
+            # The cut could fall inside a nested structure, parse everything.
+            obj = yaml.load(yaml_string, Loader=_YAML_LOADER)
+
+        if not isinstance(obj, dict):
+            return {}
+
+        return {name: value for name, value in obj.items() if isinstance(value, (str, int, bool))}
 
     @staticmethod
     def load_from_yaml(yaml_string: str, overrides: Dict[str, Any] = {}) -> 'Task':
@@ -143,8 +199,31 @@ class Task:
         overrides: additional overrides for Task parameters
         """
 
-        obj: Dict[str, Any] = yaml.safe_load(yaml_string)
-        if type(obj) is not dict:
+        obj: Dict[str, Any] = yaml.load(yaml_string, Loader=_YAML_LOADER)
+
+        return Task._load_from_object(obj, overrides)
+
+    @staticmethod
+    def load_from_yaml_file(path: str, overrides: Dict[str, Any] = {}) -> 'Task':
+        """
+        Construct a Task from a YAML file. The parser streams straight from
+        the file handle, so the file is never held in memory as a string.
+
+        Parameters
+        ----------
+        path : path to the YAML file
+        overrides: additional overrides for Task parameters
+        """
+
+        with open(path, "rb") as yaml_file:
+            obj: Dict[str, Any] = yaml.load(yaml_file, Loader=_YAML_LOADER)
+
+        return Task._load_from_object(obj, overrides)
+
+    @staticmethod
+    def _load_from_object(obj: Dict[str, Any], overrides: Dict[str, Any]) -> 'Task':
+
+        if not isinstance(obj, dict):
             raise yaml.YAMLError
 
         obj.update(overrides)
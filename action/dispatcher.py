@@ -82,10 +82,9 @@ class CommandDispatcher:
                     for f in files:
                         fp = os.path.join(path, f)
                         if fp.endswith((".yml", ".yaml")):
-                            with open(fp) as task_file:
-                                task = Task.load_from_yaml(task_file.read())
-                                task.apply_vars(self.default_vars, override_vars.get(task.name, {}))
-                                self.add_task(task)
+                            task = Task.load_from_yaml_file(fp)
+                            task.apply_vars(self.default_vars, override_vars.get(task.name, {}))
+                            self.add_task(task)
 
     def _sort_tasks(self) -> None:
         """
@@ -18,6 +18,7 @@ from devices import add_devices
 from dependencies import add_repos, add_packages
 from images import prepare_shared_directories, prepare_kernel_and_initramfs, burn_rootfs_image, shared_directories_actions
 from dispatcher import CommandDispatcher
+from concurrent.futures import ThreadPoolExecutor
 from subprocess import run
 
 from datetime import datetime
@@ -32,6 +33,25 @@ import os
 DEFAULT_IMAGE_PATH = "https://github.com/{}/releases/download/{}/image-{}-default.tar.xz"
 DEFAULT_KERNEL_PATH = "https://github.com/{}/releases/download/{}/kernel-{}-{}.tar.xz"
 
+# Action inputs expected in the JSON payload, with their default values.
+INPUT_DEFAULTS = (
+    ("arch", "riscv64"),
+    ("board", "default"),
+    ("resc", "default"),
+    ("repl", "default"),
+    ("kernel", ""),
+    ("shared-dirs", ""),
+    ("devices", ""),
+    ("python-packages", ""),
+    ("repos", ""),
+    ("image", ""),
+    ("rootfs-size", "auto"),
+    ("image-type", "native"),
+    ("tasks", ""),
+    ("network", "true"),
+    ("renode-run", ""),
+)
+
 
 def configure_board(arch: str, board: str, resc: str, repl: str):
     """
@@ -95,58 +115,64 @@ if __name__ == "__main__":
     action_repo = sys.argv[3]
     action_ref = sys.argv[4]
 
-    arch, board = configure_board(
-        args.get("arch", "riscv64"),
-        args.get("board", "default"),
-        args.get("resc", "default"),
-        args.get("repl", "default")
-    )
+    (arch_input, board_input, resc, repl, kernel, shared_dirs,
+     devices_config, python_packages_config, repos, image, rootfs_size,
+     image_type, custom_tasks, network, renode_run) = \
+        (args.get(key, default) for key, default in INPUT_DEFAULTS)
+
+    arch, board = configure_board(arch_input, board_input, resc, repl)
 
-    kernel = args.get("kernel", "")
-    if kernel.strip() == "" and board == "custom":
-        error("You have to provide custom kernel for custom board.")
-    elif kernel.strip() == "":
+    if not kernel or kernel.isspace():
+        if board == "custom":
+            error("You have to provide custom kernel for custom board.")
         kernel = DEFAULT_KERNEL_PATH.format(action_repo, action_ref, arch, board)
 
     prepare_kernel_and_initramfs(kernel)
 
-    prepare_shared_directories(args.get("shared-dirs", ""))
+    prepare_shared_directories(shared_dirs)
 
-    devices = add_devices(args.get("devices", ""))
-    python_packages = add_packages(arch, args.get("python-packages", ""))
+    devices = add_devices(devices_config)
+    python_packages = add_packages(arch, python_packages_config)
 
     optional_tasks = devices | python_packages
 
-    add_repos(args.get("repos", ""))
+    add_repos(repos)
 
-    image = args.get("image", "")
-    if image.strip() == "":
+    if not image or image.isspace():
         image = DEFAULT_IMAGE_PATH.format(action_repo, action_ref, arch)
 
     burn_rootfs_image(
         user_directory,
         image,
         arch,
-        args.get("rootfs-size", "auto"),
-        args.get("image-type", "native")
+        rootfs_size,
+        image_type
     )
 
-    for it, custom_task in enumerate(args.get("tasks", "").splitlines()):
-        get_file(custom_task, f"action/user_tasks/task{it}.yml")
+    custom_task_list = custom_tasks.splitlines()
+    if custom_task_list:
+        # The downloads are independent, fetch them concurrently.
+        with ThreadPoolExecutor(max_workers=min(8, len(custom_task_list))) as executor:
+            downloads = [
+                executor.submit(get_file, custom_task, f"action/user_tasks/task{it}.yml")
+                for it, custom_task in enumerate(custom_task_list)
+            ]
+            for download in downloads:
+                download.result()
 
     dispatcher = CommandDispatcher(board, {
-        "NOW": str(datetime.now().strftime("%Y-%m-%d %H:%M:%S")),
+        "NOW": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
         "BOARD": board
     }, optional_tasks)
 
     for task in optional_tasks:
         dispatcher.enable_task(task, True)
 
-    if args.get("network", "true") != "true" or not archs[arch].network_available:
+    if network != "true" or not archs[arch].network_available:
         for i in ["host", "renode", "target"]:
             dispatcher.enable_task(f"{i}_network", False)
 
-    dispatcher.add_task(test_task(args.get("renode-run", "")))
+    dispatcher.add_task(test_task(renode_run))
 
     dispatcher.evaluate()
 
@@ -96,13 +96,7 @@ class Shell:
     def add_task(self, task: Task) -> None:
 
         for command in task.commands:
-
-            command._apply_task_properties(
-                ["timeout", "expect", "echo", "check_exit_code", "should_fail"],
-                [-1, None, None, None, None],
-                [task.timeout, self.default_expect, task.echo, task.check_exit_code, task.should_fail]
-            )
-
+            command._apply_task_properties(task, self.default_expect)
             self._add_command(command)
 
     def run_step(self) -> Iterator[int]: